@@ -38,12 +38,9 @@ import sys
 import os
 import warnings
 import textwrap
-import time
-import threading
 import math
-import io
+import threading
 from types import SimpleNamespace
-from PIL import Image
 
 from . import external_program_calls as ex
 from .pymupdf_routines import MuPdfDocument
@@ -54,7 +51,6 @@ try:
     requires = "tkinter"
     import tkinter as tk
 except ImportError:
-    raise
     print("\nError in pdfCropMargins: The GUI feature requires {}."
           "\n\nExiting pdfcropmargins...".format(requires), file=sys.stderr)
     ex.cleanup_and_exit(1)
@@ -85,10 +81,18 @@ if ex.system_os == "Windows":
 else:
     sg.ChangeLookAndFeel("SystemDefault")
 
+# The placeholder image shown before the first page preview is rendered.  It is a
+# plain grey in-memory PGM image, which tkinter reads directly, so it is made once
+# here rather than being encoded as a PNG each time the GUI is created.
+INITIAL_IMAGE = (b"P5\n%d %d\n255\n" % INITIAL_IMAGE_SIZE
+                 + bytes((222,)) * (INITIAL_IMAGE_SIZE[0] * INITIAL_IMAGE_SIZE[1]))
+
 #
 # Helper functions for updating the values of elements.
 #
 
+QUAD_INDICES = (0, 1, 2, 3) # Indices into the 4-value options and their elements.
+
 def call_all_update_funs(update_funs, values_dict):
     """Call all the functions."""
     for f in update_funs:
@@ -96,46 +100,77 @@ def call_all_update_funs(update_funs, values_dict):
 
 def to_float_or_NA(value):
     """Convert to float unless the value is 'N/A', which is left unchanged."""
-    if value == "N/A":
-        return "N/A"
-    else:
-        return float(value)
+    return value if value == "N/A" else float(value)
 
 def to_int_or_NA(value):
-    """Convert to float unless the value is 'N/A', which is left unchanged."""
-    if value == "N/A":
-        return "N/A"
-    else:
-        return int(value)
+    """Convert to int unless the value is 'N/A', which is left unchanged."""
+    return value if value == "N/A" else int(value)
+
+def to_int_or_None(value):
+    """Convert a spinner value to int, or return `None` if it is not an integer.
+    Checked without try/except, since bad values come with each partial edit."""
+    if isinstance(value, int):
+        return value
+    text = value.strip()
+    digits = text[1:] if text[:1] in ("-", "+") else text
+    return int(text) if digits.isdecimal() else None
+
+STRING_TO_BOOL = {"True": True, "False": False}
 
 def str_to_bool(string):
     """Convert a string "True" or "False" to the boolean True or False, respectively."""
-    if string == "True":
-        return True
-    elif string == "False":
-        return False
-    else:
+    value = STRING_TO_BOOL.get(string)
+    if value is None:
         print("Error in pdfCropMargins: String cannot be converted to bool.",
               file=sys.stderr)
         ex.cleanup_and_exit(1)
+    return value
+
+def clamp_value(value, max_val=None, min_val=None):
+    """Clamp `value` to the range set by `max_val` and `min_val`, when they are
+    not `None`.  String values such as "N/A" are returned unchanged."""
+    if max_val is not None and not isinstance(value, str):
+        value = min(value, max_val)
+    if min_val is not None and not isinstance(value, str):
+        value = max(value, min_val)
+    return value
+
+def all_four_equal(values4):
+    """Return true if the four values in the sequence `values4` are all equal."""
+    return values4[0] == values4[1] == values4[2] == values4[3]
+
+def start_daemon_thread(fun, *args):
+    """Run `fun(*args)` in a daemon thread.  Return the thread and a dict which
+    gets the key "result" or "exception" when `fun` finishes.  Being a daemon,
+    the thread does not delay exiting on an interrupt or a signal."""
+    outcome = {}
+    def run_fun():
+        try:
+            outcome["result"] = fun(*args)
+        except BaseException as e: # Also keep SystemExit from cleanup_and_exit.
+            outcome["exception"] = e
+    thread = threading.Thread(target=run_fun, daemon=True)
+    thread.start()
+    return thread, outcome
 
 def update_value_and_return_it(input_text_element, value=None, fun_to_apply=None,
-                               max_val=None, min_val=None):
+                               max_val=None, min_val=None, old_text=None):
     """
     1) Get the text in the `InputText` element `input_text_element`.
     2) Apply the function `fun_to_apply` to it (if one is passed in).
     3) Update the text back to the new value.
 
-    If `value` is passed in it will be used in place of the text from step 1)."""
+    If `value` is passed in it will be used in place of the text from step 1).
+    If `old_text` is passed in it should be the text currently in the element
+    (such as its value in the `values_dict` returned by the window read), and
+    the element is only updated if the new value's text differs from it."""
     if value is None:
         value = input_text_element.Get()
     if fun_to_apply:
         value = fun_to_apply(value)
-    if max_val is not None and not isinstance(value, str):
-        value = min(value, max_val)
-    if min_val is not None and not isinstance(value, str):
-        value = max(value, min_val)
-    input_text_element.Update(value)
+    value = clamp_value(value, max_val, min_val)
+    if old_text is None or str(value) != str(old_text):
+        input_text_element.Update(value)
     return value
 
 def update_combo_box(values_dict, element, element_key, args, attr, fun_to_apply):
@@ -158,153 +193,125 @@ def update_checkbox(values_dict, element, element_key, args, attr, fun_to_apply=
         element_value = fun_to_apply(element_value)
     setattr(args, attr, element_value)
 
-def update_4_values(element_list, attr, args_dict, values_dict, value_type=float,
+def update_4_values(element_list, args_attr, values_dict, value_type=float,
                     max_val=None, min_val=None):
-    """Update four values from a 4-value argument to argparse."""
-    args_attr = args_dict[attr]
-
-    def update_all_from_args_dict():
-        for i in [0,1,2,3]:
-            update_value_and_return_it(element_list[i], value=args_attr[i],
-                                       max_val=max_val, min_val=min_val)
+    """Update four values from a 4-value argument to argparse.  The list
+    `args_attr` holds the backing values, and is modified in place."""
+    element_text4 = [values_dict[element.Key] for element in element_list]
 
     try:
-        # This comprehension is just to test that the format is correct and casts work.
-        element_text4 = [str(value_type(element_list[i].Get())) for i in [0,1,2,3]]
+        values4 = [value_type(text) for text in element_text4]
     except ValueError:
-        update_all_from_args_dict() # Replace bad text with saved version.
-        return
+        values4 = list(args_attr) # Replace bad text with saved version.
 
-    for i in [0,1,2,3]:
-        args_attr[i] = update_value_and_return_it(element_list[i],
-                                                  fun_to_apply=value_type,
-                                                  max_val=max_val, min_val=min_val)
+    for i in QUAD_INDICES:
+        # Elements are only updated if their text changes, e.g. to convert 5 to 5.0.
+        args_attr[i] = update_value_and_return_it(element_list[i], value=values4[i],
+                                                  max_val=max_val, min_val=min_val,
+                                                  old_text=element_text4[i])
 
-    # Update all, to convert forms like 5 to 5.0 (which were equal above).
-    update_all_from_args_dict()
-
-def update_paired_1_and_4_values(element, element_list4, attr, attr4, args_dict,
+def update_paired_1_and_4_values(element, element_list4, args_attr, args_attr4,
                                  values_dict, value_type=to_float_or_NA,
                                  value_type4=float, max_val=None, min_val=None):
     """Update all the value for pairs such as `percentRetain` and
     `percentRetain4`, keeping the versions with one vs. four arguments
-    synchronized."""
-    args_attr = args_dict[attr]
-    args_attr4 = args_dict[attr4]
-
-    def update_all_from_args_dict():
+    synchronized.  The lists `args_attr` and `args_attr4` hold the backing
+    values, and are modified in place."""
+    # The current element text, as read with the window.  Elements are only
+    # updated where the text changes.
+    old_text = values_dict[element.Key]
+    old_text4 = [values_dict[element4.Key] for element4 in element_list4]
+
+    def update_all_from_backing_values():
         update_value_and_return_it(element, value=args_attr[0],
-                                   max_val=max_val, min_val=min_val)
-        for i in [0,1,2,3]:
+                                   max_val=max_val, min_val=min_val, old_text=old_text)
+        for i in QUAD_INDICES:
             update_value_and_return_it(element_list4[i], value=args_attr4[i],
-                                       max_val=max_val, min_val=min_val)
+                                       max_val=max_val, min_val=min_val,
+                                       old_text=old_text4[i])
 
     try:
-        element_text = str(value_type(element.Get()))
-        #element_text = str(value_type(values_dict[attr])) # Also works.
-        element_text4 = [str(value_type4(element_list4[i].Get())) for i in [0,1,2,3]]
+        value = value_type(old_text)
+        values4 = [value_type4(text) for text in old_text4]
     except ValueError:
-        update_all_from_args_dict() # Replace bad text with saved version.
+        update_all_from_backing_values() # Replace bad text with saved version.
         return
     # See if the element value changed.
-    if value_type(element_text) != args_attr[0] and element_text != "N/A":
-        args_attr[0] = update_value_and_return_it(element, fun_to_apply=value_type,
-                                                  max_val=max_val, min_val=min_val)
-        for i in [0,1,2,3]:
-            args_attr4[i] = update_value_and_return_it(element_list4[i],
-                                                       value=args_attr[0],
-                                                       max_val=max_val, min_val=min_val)
+    if value != args_attr[0] and value != "N/A":
+        args_attr[0] = clamp_value(value, max_val, min_val)
+        for i in QUAD_INDICES:
+            args_attr4[i] = args_attr[0]
 
     # See if any of the element_list4 values changed.
-    elif any(value_type4(element_text4[i]) != args_attr4[i] for i in [0,1,2,3]):
-        for i in [0,1,2,3]:
-            args_attr4[i] = update_value_and_return_it(element_list4[i],
-                                                       fun_to_apply=value_type4,
-                                                       max_val=max_val, min_val=min_val)
-        if len(set(args_attr4)) == 1: # All are the same value.
-            args_attr[0] = update_value_and_return_it(element, value=args_attr4[0],
-                                                      max_val=max_val, min_val=min_val)
+    elif any(values4[i] != args_attr4[i] for i in QUAD_INDICES):
+        for i in QUAD_INDICES:
+            args_attr4[i] = clamp_value(values4[i], max_val, min_val)
+        if all_four_equal(args_attr4): # All are the same value.
+            args_attr[0] = args_attr4[0]
         else:
-            args_attr[0] = update_value_and_return_it(element, value="N/A")
+            args_attr[0] = "N/A"
 
     # Update all, to convert forms like 5 to 5.0 (which were equal above).
-    update_all_from_args_dict()
+    update_all_from_backing_values()
 
 ##
 ## Define the buttons/events we want to handle in the event loop.
 ##
 
-class Events(SimpleNamespace):
-    """The events to handle in the event loop.  The class is just used as a
-    namespace for holding the event tests."""
-    # When no longer supporting Python2 consider making this a SimpleNamespace instance.
-    def is_enter(btn):
-        return btn.startswith("Return:") or btn == chr(13)
-
-    def is_exit(btn):
-        return btn == chr(27) or btn.startswith("Escape:") or btn.startswith("Exit")
-
-    def is_crop(btn):
-        return btn.startswith("Crop")
-
-    def is_original(btn):
-        return btn.startswith("Original")
-
-    def is_next(btn):
-        return btn.startswith("Next") or btn == "MouseWheel:Down" # Note mouse not giving any event.
-
-    def is_prev(btn):
-        return btn.startswith("Prior:") or btn.startswith("Prev") or btn == "MouseWheel:Up"
-
-    def is_page_num_change(btn):
-        return btn.startswith("PageNumber")
-
-    def is_up(btn):
-        return btn.startswith("Up:")
-
-    def is_down(btn):
-        return btn.startswith("Down:")
-
-    def is_home(btn):
-        return btn.startswith("Home:")
-
-    def is_end(btn):
-        return btn.startswith("End:")
-
-    def is_left(btn):
-        return btn.startswith("Left:")
-
-    def is_right(btn):
-        return btn.startswith("Right:")
-
-    def is_zoom(btn):
-        return btn.startswith("Toggle Zoom")
-
-    def is_left_smallest_delta(btn):
-        return btn.startswith("left") # Note that key is always used if set, not label.
-
-    def is_top_smallest_delta(btn):
-        return btn.startswith("top")
-
-    def is_bottom_smallest_delta(btn):
-        return btn.startswith("bottom")
-
-    def is_right_smallest_delta(btn):
-        return btn.startswith("right")
-
-    def is_paired_single_and_quadruple_change(btn):
-        return btn.startswith("uniformOrderStat")
-
-    def is_evenodd(btn):
-        return btn.startswith("evenodd")
-
-    def is_general_checkbox_click(btn):
-        # Note is_evenodd is a separate event.
-        return (btn.startswith("uniform") or btn.startswith("samePageSize")
-                or btn.startswith("percentText") or btn.startswith("cropSafe"))
-
-    def is_configure(btn):
-        return btn.startswith("Configure")
+# The events to handle in the event loop, mapped to the kind of event.  Keyboard
+# events look like "Next:117", so if the full event string is not found it is
+# looked up again using the part before the colon.  The elements for 4-value
+# options have keys like `("uniformOrderStat4", i)`, and their events are looked
+# up by option name.
+EVENT_KINDS = {
+    "Return": "enter",
+    chr(13): "enter",
+    "Escape": "exit",
+    chr(27): "exit",
+    "Exit": "exit",
+    "Crop": "crop",
+    "Original": "original",
+    "Next": "next",
+    "MouseWheel:Down": "next", # Note mouse not giving any event.
+    "Prior": "prev",
+    "Prev": "prev",
+    "MouseWheel:Up": "prev",
+    "PageNumber": "page_num_change",
+    "Up": "up",
+    "Down": "down",
+    "Home": "home",
+    "End": "end",
+    "Left": "left",
+    "Right": "right",
+    "Toggle Zoom": "zoom",
+    # Note that the key is always used if set, not the label.
+    "left_smallest_delta": "smallest_delta",
+    "top_smallest_delta": "smallest_delta",
+    "bottom_smallest_delta": "smallest_delta",
+    "right_smallest_delta": "smallest_delta",
+    "uniformOrderStat": "paired_single_and_quadruple_change",
+    "uniformOrderStat4": "paired_single_and_quadruple_change",
+    "evenodd": "evenodd", # Note evenodd is separate from the general checkbox clicks.
+    "uniform": "general_checkbox_click",
+    "samePageSize": "general_checkbox_click",
+    "percentText": "general_checkbox_click",
+    "cropSafe": "general_checkbox_click",
+    "Configure": "configure",
+    }
+
+# The index in the `delta_page_nums` list for each of the smallest delta buttons.
+SMALLEST_DELTA_INDICES = {"left_smallest_delta": 0, "bottom_smallest_delta": 1,
+                          "right_smallest_delta": 2, "top_smallest_delta": 3}
+
+def classify_event(event):
+    """Return the kind of the event `event`, as listed in `EVENT_KINDS`, or `None`
+    if it is not an event that the event loop handles."""
+    if isinstance(event, tuple): # Key of a 4-value element.
+        event = event[0]
+    event_kind = EVENT_KINDS.get(event)
+    if event_kind is None and isinstance(event, str):
+        event_kind = EVENT_KINDS.get(event.partition(":")[0])
+    return event_kind
 
 #
 # The main function with the event loop.
@@ -314,11 +321,13 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                cmd_parser, parsed_args):
     """Create a GUI for running pdfCropMargins with parsed arguments `parsed_args`
     on the PDF file named `pdf_filename`"""
-    spinner_values = tuple(range(10000))
+    # Note tkinter needs spinner values as a tuple or list, so they are kept short.
+    spinner_values = tuple(range(100)) # The numBlurs and numSmooths spinners are 2 wide.
 
     args = parsed_args
-    args_dict = {} # Dict for holding "real" values backing the GUI element values.
+    args_backing = SimpleNamespace() # Holds the "real" values backing the GUI element values.
     update_funs = [] # A list of all the updating functions (defined below).
+    get_tooltip = make_tooltip_getter(cmd_parser) # Option name to tooltip.
     bounding_box_list = None # Default to return if no crop command is called.
     delta_page_nums = None # Default to return if no crop command is called.
 
@@ -340,11 +349,6 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     # Note for future: if you pass a small test window you get the GUI controls AND
     # the non-image height.  Gives an upper bound, anyway, so you could size
     # the next test image better.  Detects GUI too big to fit in window.
-    INITIAL_IMAGE = Image.new("L", INITIAL_IMAGE_SIZE, color=(222,)) # L = grey
-    with io.BytesIO() as output:
-        INITIAL_IMAGE.save(output, format="png")
-        INITIAL_IMAGE = output.getvalue() # An in-memory PNG image.
-
     max_image_size = INITIAL_IMAGE_SIZE # This is temporary; size calculated and reset below.
     im_wid, im_ht = INITIAL_IMAGE_SIZE
     image_element = sg.Image(data=INITIAL_IMAGE, key="image_element",
@@ -354,7 +358,9 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Code for handling page numbers.
     ##
 
-    input_text_page_num = sg.Spin(values=spinner_values, initial_value=str(curr_page + 1),
+    page_num_spinner_values = tuple(range(1, num_pages + 1))
+    input_text_page_num = sg.Spin(values=page_num_spinner_values,
+                                  initial_value=str(curr_page + 1),
                                   size=(5, 1), enable_events=True, key="PageNumber")
     text_page_num = sg.Text("Page:")
 
@@ -367,66 +373,55 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
         return curr_page
 
     ##
-    ## Code for percentRetain options.
+    ## Code for creating paired options like percentRetain and percentRetain4.
     ##
 
-    args_dict["percentRetain"] = args.percentRetain
-    if len(set(args.percentRetain4)) != 1: # Set initial value if all the same.
-        args_dict["percentRetain"] = ["N/A"]
-    text_percentRetain = sg.Text("percentRetain",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "percentRetain"))
-    input_text_percentRetain = sg.InputText(args_dict["percentRetain"][0], pad=(0,0),
-                                 size=(5, 1), do_not_clear=True, key="percentRetain")
-
-    # Code for percentRetain4.
-    args_dict["percentRetain4"] = args.percentRetain4
-    text_percentRetain4 = sg.Text("percentRetain4",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "percentRetain4"))
-    input_text_percentRetain4 = [sg.InputText(args_dict["percentRetain4"][i], size=(5, 1),
-                                 do_not_clear=True, key=f"percentRetain4_{i}", pad=(1,0))
-                                 for i in [0,1,2,3]]
-
-    def update_percentRetain_values(values_dict):
-        """Update both the percentRetain value and the percentRetain4 values."""
-        update_paired_1_and_4_values(input_text_percentRetain,
-                    input_text_percentRetain4, "percentRetain", "percentRetain4",
-                    args_dict, values_dict)
-        # Copy backing values to the actual args object.
-        args.percentRetain = args_dict["percentRetain"]
-        args.percentRetain4 = args_dict["percentRetain4"]
+    def make_paired_1_and_4_elements(attr, attr4):
+        """Create the text and input elements for a pair of options with one and
+        four float values, such as `percentRetain` and `percentRetain4`, and
+        register the function to update them.  Returns the text and input
+        elements for `attr` followed by those for `attr4`."""
+        backing_values = getattr(args, attr)
+        if not all_four_equal(getattr(args, attr4)): # Set initial value if all the same.
+            backing_values = ["N/A"]
+        setattr(args_backing, attr, backing_values)
+        text = sg.Text(attr, tooltip=get_tooltip(attr))
+        input_text = sg.InputText(backing_values[0], pad=(0,0),
+                                  size=(5, 1), do_not_clear=True, key=attr)
+
+        backing_values4 = getattr(args, attr4)
+        setattr(args_backing, attr4, backing_values4)
+        text4 = sg.Text(attr4, tooltip=get_tooltip(attr4))
+        input_text4 = [sg.InputText(backing_values4[i], size=(5, 1), do_not_clear=True,
+                                    key=(attr4, i), pad=(1,0))
+                       for i in QUAD_INDICES]
+
+        def update_values(values_dict):
+            """Update both the single value and the four values."""
+            update_paired_1_and_4_values(input_text, input_text4, backing_values,
+                                         backing_values4, values_dict)
+            # Copy backing values to the actual args object.
+            setattr(args, attr, backing_values)
+            setattr(args, attr4, backing_values4)
+
+        update_funs.append(update_values)
+        return text, input_text, text4, input_text4
 
-    update_funs.append(update_percentRetain_values)
+    ##
+    ## Code for percentRetain options.
+    ##
+
+    paired_elements = make_paired_1_and_4_elements("percentRetain", "percentRetain4")
+    (text_percentRetain, input_text_percentRetain,
+     text_percentRetain4, input_text_percentRetain4) = paired_elements
 
     ##
     ## Code for absoluteOffset options.
     ##
 
-    args_dict["absoluteOffset"] = args.absoluteOffset
-    if len(set(args.absoluteOffset4)) != 1: # Set initial value if all the same.
-        args_dict["absoluteOffset"] = ["N/A"]
-    text_absoluteOffset = sg.Text("absoluteOffset",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "absoluteOffset"))
-    input_text_absoluteOffset = sg.InputText(args_dict["absoluteOffset"][0], pad=(0,0),
-                                 size=(5, 1), do_not_clear=True, key="absoluteOffset")
-
-    # Code for absoluteOffset4.
-    args_dict["absoluteOffset4"] = args.absoluteOffset4
-    text_absoluteOffset4 = sg.Text("absoluteOffset4",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "absoluteOffset4"))
-    input_text_absoluteOffset4 = [sg.InputText(args_dict["absoluteOffset4"][i], size=(5, 1),
-                                 do_not_clear=True, key=f"absoluteOffset4_{i}", pad=(1,0))
-                                 for i in [0,1,2,3]]
-
-    def update_absoluteOffset_values(values_dict):
-        """Update both the absoluteOffset value and the absoluteOffset4 values."""
-        update_paired_1_and_4_values(input_text_absoluteOffset,
-                    input_text_absoluteOffset4, "absoluteOffset", "absoluteOffset4",
-                    args_dict, values_dict)
-        # Copy backing values to the actual args object.
-        args.absoluteOffset = args_dict["absoluteOffset"]
-        args.absoluteOffset4 = args_dict["absoluteOffset4"]
-
-    update_funs.append(update_absoluteOffset_values)
+    paired_elements = make_paired_1_and_4_elements("absoluteOffset", "absoluteOffset4")
+    (text_absoluteOffset, input_text_absoluteOffset,
+     text_absoluteOffset4, input_text_absoluteOffset4) = paired_elements
 
     ##
     ## Code for uniformOrderStat options.
@@ -434,49 +429,50 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
     uniformOrderStat_spinner_values = tuple(range(0, num_pages))
     if args.uniformOrderStat:
-        args_dict["uniformOrderStat"] = args.uniformOrderStat
+        args_backing.uniformOrderStat = args.uniformOrderStat
     else:
-        args_dict["uniformOrderStat"] = [0]
+        args_backing.uniformOrderStat = [0]
 
     if args.uniformOrderStat4:
-        args_dict["uniformOrderStat4"] = args.uniformOrderStat4
-        if len(set(args.uniformOrderStat4)) != 1: # Set initial value if all the same.
-            args_dict["uniformOrderStat"] = [0]
+        args_backing.uniformOrderStat4 = args.uniformOrderStat4
+        if not all_four_equal(args.uniformOrderStat4): # Set initial value if all the same.
+            args_backing.uniformOrderStat = [0]
         else:
-            args_dict["uniformOrderStat"] = [args.uniformOrderStat4[0]]
+            args_backing.uniformOrderStat = [args.uniformOrderStat4[0]]
     elif args.uniformOrderStat:
-        args_dict["uniformOrderStat4"] = [args.uniformOrderStat[0]] * 4
+        args_backing.uniformOrderStat4 = [args.uniformOrderStat[0]] * 4
     else:
-        args_dict["uniformOrderStat4"] = [0] * 4
+        args_backing.uniformOrderStat4 = [0] * 4
 
     dummy_spacing_spinner = sg.Text("", size=(7,1), pad=(0,0))
 
     text_uniformOrderStat = sg.Text("uniformOrderStat",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "uniformOrderStat"))
+                      tooltip=get_tooltip("uniformOrderStat"))
     input_text_uniformOrderStat = sg.Spin(values=uniformOrderStat_spinner_values,
-                                 initial_value=args_dict["uniformOrderStat"][0], pad=(0,0),
+                                 initial_value=args_backing.uniformOrderStat[0], pad=(0,0),
                                  size=(5, 1), enable_events=True, key="uniformOrderStat")
 
     # Code for uniformOrderStat4.
     text_uniformOrderStat4 = sg.Text("uniformOrderStat4",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "uniformOrderStat4"))
+                      tooltip=get_tooltip("uniformOrderStat4"))
     input_text_uniformOrderStat4 = [sg.Spin(values=uniformOrderStat_spinner_values,
-                                    initial_value=args_dict["uniformOrderStat4"][i], size=(5, 1),
-                                    enable_events=True, key=f"uniformOrderStat4_{i}", pad=(1,0))
-                                    for i in [0,1,2,3]]
+                                    initial_value=args_backing.uniformOrderStat4[i], size=(5, 1),
+                                    enable_events=True, key=("uniformOrderStat4", i),
+                                    pad=(1,0))
+                                    for i in QUAD_INDICES]
 
     def update_uniformOrderStat_values(values_dict):
         """Update both the uniformOrderStat value and the uniformOrderStat4 values."""
         update_paired_1_and_4_values(input_text_uniformOrderStat,
-              input_text_uniformOrderStat4, "uniformOrderStat",
-              "uniformOrderStat4", args_dict, values_dict,
+              input_text_uniformOrderStat4, args_backing.uniformOrderStat,
+              args_backing.uniformOrderStat4, values_dict,
               value_type=to_int_or_NA, value_type4=int, max_val=num_pages-1, min_val=0)
         # Copy backing values to the actual args object.
         args.uniformOrderStat = [] # Not needed with uniformOrderStat4 always set.
-        if all(i == 0 for i in args_dict["uniformOrderStat4"]):
+        if all(i == 0 for i in args_backing.uniformOrderStat4):
             args.uniformOrderStat4 = [] # Need to empty it, since it implies uniform option.
         else:
-            args.uniformOrderStat4 = args_dict["uniformOrderStat4"]
+            args.uniformOrderStat4 = args_backing.uniformOrderStat4
 
     update_funs.append(update_uniformOrderStat_values)
 
@@ -485,8 +481,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ##
 
     checkbox_uniform = sg.Checkbox("uniform", pad=((0,10), None), key="uniform",
-                                    tooltip=get_help_text_string_for_tooltip(cmd_parser,
-                                        "uniform"),
+                                    tooltip=get_tooltip("uniform"),
                                     enable_events=True, default=args.uniform)
 
     def update_uniform(values_dict):
@@ -501,8 +496,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
     checkbox_samePageSize = sg.Checkbox("samePageSize", pad=((0,10), None),
                                          key="samePageSize", enable_events=True,
-                                         tooltip=get_help_text_string_for_tooltip(
-                                             cmd_parser, "samePageSize"),
+                                         tooltip=get_tooltip("samePageSize"),
                                          default=args.samePageSize)
 
     def update_samePageSize(values_dict):
@@ -518,8 +512,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
     checkbox_evenodd = sg.Checkbox("evenodd", pad=((0,0), None),
                                     key="evenodd", enable_events=True,
-                                    tooltip=get_help_text_string_for_tooltip(
-                                        cmd_parser, "evenodd"),
+                                    tooltip=get_tooltip("evenodd"),
                                     default=args.evenodd)
 
     def update_evenodd(values_dict):
@@ -533,8 +526,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ##
 
     checkbox_percentText = sg.Checkbox("percentText", pad=((0,10), None), key="percentText",
-                                    tooltip=get_help_text_string_for_tooltip(cmd_parser,
-                                        "percentText"),
+                                    tooltip=get_tooltip("percentText"),
                                     enable_events=True, default=args.percentText)
 
     def update_percentText(values_dict):
@@ -548,8 +540,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ##
 
     checkbox_cropSafe = sg.Checkbox("cropSafe", pad=((0,10), None), key="cropSafe",
-                                    tooltip=get_help_text_string_for_tooltip(cmd_parser,
-                                        "cropSafe"),
+                                    tooltip=get_tooltip("cropSafe"),
                                     enable_events=True, default=args.cropSafe)
 
     def update_cropSafe(values_dict):
@@ -563,26 +554,28 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Code for pages option.
     ##
 
-    args_dict["pages"] = args.pages if args.pages else ""
+    args_backing.pages = args.pages if args.pages else ""
     text_pages = sg.Text("pages", pad=((0,22), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "pages"))
-    input_text_pages = sg.InputText(args_dict["pages"],
+                      tooltip=get_tooltip("pages"))
+    input_text_pages = sg.InputText(args_backing.pages,
                                  size=(7, 1), do_not_clear=True, key="pages")
+    checked_pages_values = set() # Page specifiers already parsed without errors.
 
     def update_pages_values(values_dict):
         """Update the pages value."""
         value = values_dict["pages"]
         try:
-            if value: # Parse here only to test for errors.
+            if value and value not in checked_pages_values: # Parse only to test for errors.
                 parse_page_range_specifiers(value, set(range(num_pages)))
+                checked_pages_values.add(value)
         except ValueError:
             sg.PopupError(f"Bad page specifier '{value}'.")
             input_text_pages.Update("")
-            args_dict["pages"] = ""
+            args_backing.pages = ""
         else:
-            args_dict["pages"] = values_dict["pages"]
+            args_backing.pages = values_dict["pages"]
         # Copy backing value to the actual args object.
-        args.pages = args_dict["pages"] if args_dict["pages"] else None
+        args.pages = args_backing.pages if args_backing.pages else None
 
     update_funs.append(update_pages_values)
 
@@ -591,7 +584,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ##
 
     text_restore = sg.Text("restore", pad=(0,0),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "restore"))
+                      tooltip=get_tooltip("restore"))
 
     combo_box_restore = sg.Combo(["True", "False"], readonly=True,
                                  default_value=str(args.restore), size=(5, 1),
@@ -608,29 +601,29 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Code for setPageRatios option.
     ##
 
-    args_dict["setPageRatios"] = args.setPageRatios if args.setPageRatios else ""
+    args_backing.setPageRatios = args.setPageRatios if args.setPageRatios else ""
     text_setPageRatios = sg.Text("setPageRatios", pad=((0,25), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "setPageRatios"))
-    input_text_setPageRatios = sg.InputText(args_dict["setPageRatios"], pad=(0,0),
+                      tooltip=get_tooltip("setPageRatios"))
+    input_text_setPageRatios = sg.InputText(args_backing.setPageRatios, pad=(0,0),
                                  size=(7, 1), do_not_clear=True, key="setPageRatios")
+    parsed_page_ratios = {} # Parsed values of the page ratio specifiers seen so far.
 
     def update_setPageRatios_values(values_dict):
         """Update the setPageRatios value."""
         value = values_dict["setPageRatios"]
         try:
-            if value:
-                parse_page_ratio_argument(value)
+            if value and value not in parsed_page_ratios:
+                parsed_page_ratios[value] = parse_page_ratio_argument(value)
+            parsed_value = parsed_page_ratios.get(value) # None for an empty value.
         except ValueError:
             sg.PopupError("Bad page ratio specifier.")
             input_text_setPageRatios.Update("")
-            args_dict["setPageRatios"] = ""
+            args_backing.setPageRatios = ""
+            parsed_value = None
         else:
-            args_dict["setPageRatios"] = values_dict["setPageRatios"]
-        # Copy backing value to the actual args object.
-        if args_dict["setPageRatios"]:
-            args.setPageRatios = parse_page_ratio_argument(args_dict["setPageRatios"])
-        else:
-            args.setPageRatios = None
+            args_backing.setPageRatios = value
+        # Copy the parsed backing value to the actual args object.
+        args.setPageRatios = parsed_value
 
     update_funs.append(update_setPageRatios_values)
 
@@ -638,19 +631,21 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Code for pageRatioWeights options.
     ##
 
-    args_dict["pageRatioWeights"] = args.pageRatioWeights
+    args_backing.pageRatioWeights = args.pageRatioWeights
     text_pageRatioWeights = sg.Text("pageRatioWeights",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "pageRatioWeights"))
-    input_text_pageRatioWeights = [sg.InputText(args_dict["pageRatioWeights"][i], size=(5, 1),
-                                 do_not_clear=True, key=f"pageRatioWeights_{i}", pad=(1,0))
-                                 for i in [0,1,2,3]]
+                      tooltip=get_tooltip("pageRatioWeights"))
+    input_text_pageRatioWeights = [sg.InputText(args_backing.pageRatioWeights[i], size=(5, 1),
+                                 do_not_clear=True, key=("pageRatioWeights", i),
+                                 pad=(1,0))
+                                 for i in QUAD_INDICES]
 
     def update_pageRatioWeights_values(values_dict):
         """Update both the pageRatioWeights value and the pageRatioWeights values."""
-        update_4_values(input_text_pageRatioWeights, "pageRatioWeights", args_dict, values_dict)
+        update_4_values(input_text_pageRatioWeights, args_backing.pageRatioWeights,
+                        values_dict)
 
         # Copy backing values to the actual args object.
-        args.pageRatioWeights = args_dict["pageRatioWeights"]
+        args.pageRatioWeights = args_backing.pageRatioWeights
 
     update_funs.append(update_pageRatioWeights_values)
 
@@ -658,116 +653,98 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Code for absolutePreCrop options.
     ##
 
-    args_dict["absolutePreCrop"] = args.absolutePreCrop
-    if len(set(args.absolutePreCrop4)) != 1: # Set initial value if all the same.
-        args_dict["absolutePreCrop"] = ["N/A"]
-    text_absolutePreCrop = sg.Text("absolutePreCrop",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "absolutePreCrop"))
-    input_text_absolutePreCrop = sg.InputText(args_dict["absolutePreCrop"][0], pad=(0,0),
-                                 size=(5, 1), do_not_clear=True, key="absolutePreCrop")
-
-    # Code for absolutePreCrop4.
-    args_dict["absolutePreCrop4"] = args.absolutePreCrop4
-    text_absolutePreCrop4 = sg.Text("absolutePreCrop4",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "absolutePreCrop4"))
-    input_text_absolutePreCrop4 = [sg.InputText(args_dict["absolutePreCrop4"][i], size=(5, 1),
-                                 do_not_clear=True, key=f"absolutePreCrop4_{i}", pad=(1,0))
-                                 for i in [0,1,2,3]]
-
-    def update_absolutePreCrop_values(values_dict):
-        """Update both the absolutePreCrop value and the absolutePreCrop4 values."""
-        update_paired_1_and_4_values(input_text_absolutePreCrop,
-                    input_text_absolutePreCrop4, "absolutePreCrop", "absolutePreCrop4",
-                    args_dict, values_dict)
-        # Copy backing values to the actual args object.
-        args.absolutePreCrop = args_dict["absolutePreCrop"]
-        args.absolutePreCrop4 = args_dict["absolutePreCrop4"]
-
-    update_funs.append(update_absolutePreCrop_values)
+    paired_elements = make_paired_1_and_4_elements("absolutePreCrop", "absolutePreCrop4")
+    (text_absolutePreCrop, input_text_absolutePreCrop,
+     text_absolutePreCrop4, input_text_absolutePreCrop4) = paired_elements
 
     ##
     ## Code for threshold option.
     ##
 
-    args_dict["threshold"] = int(args.threshold[0]) if args.calcbb != "gb" else "----"
+    # The threshold, numBlurs, and numSmooths options are not used with the gb method.
+    def make_unused_spinner_update_fun(spinner, element_key, placeholder):
+        """Return an update function that keeps `placeholder` shown in `spinner`."""
+        def update_unused_spinner(values_dict):
+            if values_dict[element_key] != placeholder:
+                spinner.Update(placeholder)
+        return update_unused_spinner
+
+    args_backing.threshold = int(args.threshold[0]) if args.calcbb != "gb" else "----"
     text_threshold = sg.Text("threshold", pad=((0,0), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "threshold"))
+                      tooltip=get_tooltip("threshold"))
     input_num_threshold = sg.Spin(values=tuple(range(256)),
-                                  initial_value=args_dict["threshold"],
+                                  initial_value=args_backing.threshold,
                                   size=(3, 1), key="threshold")
 
     def update_threshold_values(values_dict):
         """Update the threshold value."""
-        if args.calcbb == "gb":
-            input_num_threshold.Update("----")
-            return
-        try:
-            value = int(values_dict["threshold"])
+        value = to_int_or_None(values_dict["threshold"])
+        if value is None:
+            value = args_backing.threshold
+        else:
             value = min(max(value, 0),  255)
-            args_dict["threshold"] = value
-        except ValueError:
-            value = args_dict["threshold"]
-        input_num_threshold.Update(value)
+            args_backing.threshold = value
+        if str(values_dict["threshold"]) != str(value): # Only update changed values.
+            input_num_threshold.Update(value)
         # Copy backing value to the actual args object.
-        args.threshold = [args_dict["threshold"]]
+        args.threshold = [args_backing.threshold]
 
-    update_funs.append(update_threshold_values)
+    update_funs.append(update_threshold_values if args.calcbb != "gb" else
+                       make_unused_spinner_update_fun(input_num_threshold, "threshold", "----"))
 
     ##
     ## Code for numBlurs option.
     ##
 
-    args_dict["numBlurs"] = int(args.numBlurs) if args.calcbb != "gb" else "--"
+    args_backing.numBlurs = int(args.numBlurs) if args.calcbb != "gb" else "--"
     text_numBlurs = sg.Text("numBlurs", pad=((0,0), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "numBlurs"))
+                      tooltip=get_tooltip("numBlurs"))
     input_num_numBlurs = sg.Spin(values=spinner_values,
-                                 initial_value=args_dict["numBlurs"],
+                                 initial_value=args_backing.numBlurs,
                                  size=(2, 1), key="numBlurs")
 
     def update_numBlurs_values(values_dict):
         """Update the numBlurs value."""
-        if args.calcbb == "gb":
-            input_num_numBlurs.Update("--")
-            return
-        try:
-            value = int(values_dict["numBlurs"])
+        value = to_int_or_None(values_dict["numBlurs"])
+        if value is None:
+            value = args_backing.numBlurs
+        else:
             value = max(value, 0)
-            args_dict["numBlurs"] = value
-        except ValueError:
-            value = args_dict["numBlurs"]
-        input_num_numBlurs.Update(value)
+            args_backing.numBlurs = value
+        if str(values_dict["numBlurs"]) != str(value): # Only update changed values.
+            input_num_numBlurs.Update(value)
         # Copy backing value to the actual args object.
-        args.numBlurs = args_dict["numBlurs"]
+        args.numBlurs = args_backing.numBlurs
 
-    update_funs.append(update_numBlurs_values)
+    update_funs.append(update_numBlurs_values if args.calcbb != "gb" else
+                       make_unused_spinner_update_fun(input_num_numBlurs, "numBlurs", "--"))
 
     ##
     ## Code for numSmooths option.
     ##
 
-    args_dict["numSmooths"] = int(args.numSmooths) if args.calcbb != "gb" else "--"
+    args_backing.numSmooths = int(args.numSmooths) if args.calcbb != "gb" else "--"
     text_numSmooths = sg.Text("numSmooths", pad=((0,0), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "numSmooths"))
+                      tooltip=get_tooltip("numSmooths"))
     input_num_numSmooths = sg.Spin(values=spinner_values,
-                                   initial_value=args_dict["numSmooths"],
+                                   initial_value=args_backing.numSmooths,
                                    size=(2, 1), key="numSmooths")
 
     def update_numSmooths_values(values_dict):
         """Update the numSmooths value."""
-        if args.calcbb == "gb":
-            input_num_numSmooths.Update("--")
-            return
-        try:
-            value = int(values_dict["numSmooths"])
+        value = to_int_or_None(values_dict["numSmooths"])
+        if value is None:
+            value = args_backing.numSmooths
+        else:
             value = max(value, 0)
-            args_dict["numSmooths"] = value
-        except ValueError:
-            value = args_dict["numSmooths"]
-        input_num_numSmooths.Update(value)
+            args_backing.numSmooths = value
+        if str(values_dict["numSmooths"]) != str(value): # Only update changed values.
+            input_num_numSmooths.Update(value)
         # Copy backing value to the actual args object.
-        args.numSmooths = args_dict["numSmooths"]
+        args.numSmooths = args_backing.numSmooths
 
-    update_funs.append(update_numSmooths_values)
+    update_funs.append(update_numSmooths_values if args.calcbb != "gb" else
+                       make_unused_spinner_update_fun(input_num_numSmooths, "numSmooths", "--"))
 
 
     ##
@@ -807,17 +784,23 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                      sg.Column([[smallest_delta_right]], pad=(0,0)), # Extraneous col.
                                     ]
 
+    shown_delta_values = [None] # The (delta_page_nums, disabled) currently shown.
+
     def update_smallest_delta_values_display(delta_page_nums, disabled=False):
+        if shown_delta_values[0] == (tuple(delta_page_nums), disabled):
+            return
+        shown_delta_values[0] = (tuple(delta_page_nums), disabled)
         smallest_delta_label_text.Update("Minimum cropping delta pages:")
-        num_strings = [f"{i}" for i in delta_page_nums]
+        num_strings = [str(i) for i in delta_page_nums]
         max_len = max(len(i) for i in num_strings)
-        num_strings = [" "*(max_len-len(i)) + i for i in num_strings] # Right-align.
+        num_strings = [i.rjust(max_len) for i in num_strings] # Right-align.
         smallest_delta_left.Update(num_strings[0], visible=True, disabled=disabled)
         smallest_delta_top.Update(num_strings[3], visible=True, disabled=disabled)
         smallest_delta_bottom.Update(num_strings[1], visible=True, disabled=disabled)
         smallest_delta_right.Update(num_strings[2], visible=True, disabled=disabled)
 
     def set_delta_values_null():
+        shown_delta_values[0] = None
         smallest_delta_label_text.Update("")
         smallest_delta_left.Update("", visible=False, disabled=True)
         smallest_delta_top.Update("", visible=False, disabled=True)
@@ -834,15 +817,17 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
         return page_num, toggle
 
     ##
-    ## Page image update and thread to redraw images on a configure/resize event.
+    ## Page image update and redrawing images on a configure/resize event.
     ##
 
-    def get_max_image_size(window):
+    def get_max_image_size(window_size):
         """Return the largest size rectangle for the PDF image to fit into (after
-        subtracting off the size of the non-image parts of the GUI).  This function
-        should be called on a zoomed/fullscreen window."""
-        max_image_size = (max(window.size[0]-non_image_size[0], FALLBACK_MAX_IMAGE_SIZE[0]),
-                          max(window.size[1]-non_image_size[1], FALLBACK_MAX_IMAGE_SIZE[1]))
+        subtracting off the size of the non-image parts of the GUI).  The
+        `window_size` argument is the already-read `window.size`, since reading
+        it queries tkinter.  This function should be called on a
+        zoomed/fullscreen window."""
+        max_image_size = (max(window_size[0]-non_image_size[0], FALLBACK_MAX_IMAGE_SIZE[0]),
+                          max(window_size[1]-non_image_size[1], FALLBACK_MAX_IMAGE_SIZE[1]))
         return max_image_size
 
     def update_page_image(window, reset_cached=False, zoom=False, max_image_size=None,
@@ -852,7 +837,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
         If `update_image_element` is true (the default) then the GUI image is
         updated with the newly calculated image data."""
         if max_image_size is None:
-            max_image_size = get_max_image_size(window)
+            max_image_size = get_max_image_size(window.size)
         image_data, clip_pos, im_ht, im_wid = document_pages.get_display_page(curr_page,
                                                     max_image_size=max_image_size,
                                                     zoom=zoom, reset_cached=reset_cached)
@@ -877,48 +862,43 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                            non_image_size[1] + ht)
         window.size = new_window_size
 
-    RESIZE_DELAY_SECS = 0.5 # Time to delay while user resizes window.
-    resize_thread_running = False # Flag to only run one update thread.
-    request_thread_exit = False # Flag used to kill thread on exit.
-
-    def resize_page_on_configure_event(delay_secs=RESIZE_DELAY_SECS,
-                                       max_image_size=None):
-        """This function is run as a thread to redraw preview pages on configure
-        events once the size stabilizes.  Note that this routine sets the nonlocal
-        variables `user_selected_max_image_size`, `old_window_size` (and the flag
-        `resize_thread_running`).  Resize scaling is to make the image fit in
-        the max window size, according to it's largest dimension (width or height)"""
-        nonlocal resize_thread_running, old_window_size, user_selected_max_image_size
-        resize_thread_running = True
-
-        # Wait for user to finish resizing.
-        time.sleep(delay_secs)
-        while window.size != old_window_size:
-            if request_thread_exit:
-                return
-            old_window_size = window.size
-            time.sleep(delay_secs)
+    RESIZE_DELAY_MSECS = 80 # Time to wait after the last configure event to redraw.
+    resize_after_id = None # Id of the pending Tk `after` callback to redraw.
+
+    def schedule_resize_on_configure_event():
+        """Debounce configure events by (re)scheduling the redraw as a Tk `after`
+        callback, so it only runs once the user stops resizing the window."""
+        nonlocal resize_after_id
+        if resize_after_id is not None:
+            window.TKroot.after_cancel(resize_after_id)
+        resize_after_id = window.TKroot.after(RESIZE_DELAY_MSECS,
+                                              resize_page_on_configure_event)
+
+    def resize_page_on_configure_event(max_image_size=None):
+        """Redraw preview pages after configure events once the size stabilizes.
+        Note that this routine sets the nonlocal variables
+        `user_selected_max_image_size`, `old_window_size` and `resize_after_id`.
+        Resize scaling is to make the image fit in the max window size, according
+        to it's largest dimension (width or height)"""
+        nonlocal resize_after_id, old_window_size, user_selected_max_image_size
+        if resize_after_id is not None: # Cancel any pending redraw.
+            window.TKroot.after_cancel(resize_after_id)
+            resize_after_id = None
 
         if max_image_size is None:
-            max_image_size = get_max_image_size(window)
+            max_image_size = get_max_image_size(window.size)
         # Note that if user_selected_max_image_size is passed in it gets reset to itself.
         user_selected_max_image_size = max_image_size # Saved as a user preference.
 
-        if request_thread_exit:
-            return
         resize_window(window, document_pages, max_image_size, non_image_size)
 
-        if request_thread_exit:
-            return
         # TODO: Is this update_page_image really necessary?  Should it come before
         # or after resize of window?
         image_data, clip_pos, im_ht, im_wid = update_page_image(window,
                                                                 reset_cached=True,
                                                                 zoom=zoom)
 
-        # Set the old window size and exit thread.
         old_window_size = window.size
-        resize_thread_running = False
 
     ##
     ## Code for disabling options that are implied by others.
@@ -933,7 +913,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
         # is currently not working so it just disables/enables in whatever state.
         if args.uniformOrderStat4 or values_dict["evenodd"]:
             backing_uniform_checkbox_value[0] = values_dict["uniform"]
-            checkbox_uniform.Update(True, disabled=True) # Show that these options imply uniform.
+            if not (checkbox_uniform.Disabled and values_dict["uniform"]):
+                checkbox_uniform.Update(True, disabled=True) # Show that these options imply uniform.
         else:
             if checkbox_uniform.Disabled:
                 checkbox_uniform.Update(backing_uniform_checkbox_value[0], disabled=False)
@@ -944,6 +925,19 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Setup and assign the window's layout.
     ##
 
+    def make_quadruple_row(input_text4, text4):
+        """Return a layout row for a quadruple of input elements and their label,
+        with the top and bottom elements stacked between the left and right ones."""
+        return [input_text4[0],
+                sg.Column([[input_text4[3]],
+                           [input_text4[1]]], pad=(0,5)),
+                input_text4[2], text4]
+
+    def make_spacer_text(input_text, input_text4):
+        """Return an empty text element that shifts a single-value input over to
+        line up with the quadruple row below it."""
+        return sg.Text("", size=input_text.Size, pad=input_text4[0].Pad)
+
     layout = [ # The overall window layout.
         [
             sg.Button("Prev"),
@@ -985,57 +979,38 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                     [checkbox_uniform, checkbox_samePageSize, checkbox_evenodd],
 
                     # percentRetain
-                    [sg.Text("", size=input_text_percentRetain.Size,
-                             pad=input_text_percentRetain4[0].Pad), # Empty text is space.
+                    [make_spacer_text(input_text_percentRetain, input_text_percentRetain4),
                         input_text_percentRetain, text_percentRetain, checkbox_percentText],
 
                     # percentRetain4
-                    [input_text_percentRetain4[0],
-                        sg.Column([[input_text_percentRetain4[3]],
-                                   [input_text_percentRetain4[1]]], pad=(0,5)),
-                        input_text_percentRetain4[2]] + [text_percentRetain4],
+                    make_quadruple_row(input_text_percentRetain4, text_percentRetain4),
 
                     # absoluteOffset
-                    [sg.Text("", size=input_text_absoluteOffset.Size,
-                             pad=input_text_absoluteOffset4[0].Pad), # Empty text is space.
+                    [make_spacer_text(input_text_absoluteOffset, input_text_absoluteOffset4),
                         input_text_absoluteOffset, text_absoluteOffset, checkbox_cropSafe],
 
                     # absoluteOffset4
-                    [input_text_absoluteOffset4[0],
-                        sg.Column([[input_text_absoluteOffset4[3]],
-                                   [input_text_absoluteOffset4[1]]], pad=(0,5)),
-                        input_text_absoluteOffset4[2]] + [text_absoluteOffset4],
+                    make_quadruple_row(input_text_absoluteOffset4, text_absoluteOffset4),
 
                     # uniformOrderStat
                     [dummy_spacing_spinner, input_text_uniformOrderStat, text_uniformOrderStat],
 
                     # uniformOrderStat4
-                    [input_text_uniformOrderStat4[0],
-                        sg.Column([[input_text_uniformOrderStat4[3]],
-                                   [input_text_uniformOrderStat4[1]]], pad=(0,5)),
-                        input_text_uniformOrderStat4[2]] + [text_uniformOrderStat4],
+                    make_quadruple_row(input_text_uniformOrderStat4, text_uniformOrderStat4),
 
                     # setPageRatios
-                    [sg.Text("", size=input_text_uniformOrderStat.Size,
-                             pad=input_text_uniformOrderStat4[0].Pad), # Empty text is space.
+                    [make_spacer_text(input_text_uniformOrderStat, input_text_uniformOrderStat4),
                         input_text_setPageRatios, text_setPageRatios],
 
                     # pageRatioWeights
-                    [input_text_pageRatioWeights[0],
-                        sg.Column([[input_text_pageRatioWeights[3]],
-                                   [input_text_pageRatioWeights[1]]], pad=(0,5)),
-                        input_text_pageRatioWeights[2]] + [text_pageRatioWeights],
+                    make_quadruple_row(input_text_pageRatioWeights, text_pageRatioWeights),
 
                     # absolutePreCrop
-                    [sg.Text("", size=input_text_absolutePreCrop.Size,
-                             pad=input_text_absolutePreCrop4[0].Pad), # Empty text is space.
+                    [make_spacer_text(input_text_absolutePreCrop, input_text_absolutePreCrop4),
                         input_text_absolutePreCrop, text_absolutePreCrop],
 
                     # absolutePreCrop4
-                    [input_text_absolutePreCrop4[0],
-                        sg.Column([[input_text_absolutePreCrop4[3]],
-                                   [input_text_absolutePreCrop4[1]]], pad=(0,5)),
-                        input_text_absolutePreCrop4[2]] + [text_absolutePreCrop4],
+                    make_quadruple_row(input_text_absolutePreCrop4, text_absolutePreCrop4),
 
                     # threshold, numBlurs, numSmooths
                     [input_num_threshold, text_threshold, input_num_numBlurs,
@@ -1143,22 +1118,66 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                                             max_image_size=max_image_size)
     old_window_size = window.size
 
+    # Do all the pending redraws from the updates above at once, while still invisible.
+    window.TKroot.update_idletasks()
     window.alpha_channel = 1 # Make the window visible.
 
+    PREFETCH_DELAY_MSECS = 50 # Idle time before rendering neighboring pages.
+
+    def get_pages_to_prefetch(step=1):
+        """Return the neighboring pages of the current page to render while idle.
+        The `step` is +1 or -1 for the direction the user is paging in, and the
+        next page in that direction comes first."""
+        if zoom:
+            return []
+        return [p for p in (curr_page + step, curr_page - step) if 0 <= p < num_pages]
+
+    # A zero timeout would process all the pending Tk events at once and only return
+    # the last one, so use a tiny timeout to read the queued events one at a time.
+    QUEUED_EVENT_READ_TIMEOUT_MSECS = 1
+
+    def read_queued_page_navigation_events(curr_page):
+        """Apply any queued page navigation events (like from a held-down key or
+        the mouse wheel) to `curr_page` without rendering the pages in between.
+        Return the new page and the first queued non-navigation read, or `None`."""
+        curr_page = max(min(curr_page, num_pages-1), 0)
+        shown_page = None
+        while True:
+            # Show the coalesced page before each read, so that the page number in
+            # the values of a saved non-navigation read is up to date.
+            if shown_page != curr_page:
+                input_text_page_num.Update(str(curr_page + 1))
+                shown_page = curr_page
+            queued_read = window.Read(timeout=QUEUED_EVENT_READ_TIMEOUT_MSECS)
+            queued_event_kind = classify_event(queued_read[0])
+            if queued_event_kind == "next":
+                curr_page = min(curr_page + 1, num_pages-1)
+            elif queued_event_kind == "prev":
+                curr_page = max(curr_page - 1, 0)
+            elif queued_event_kind == "home":
+                curr_page = 0
+            elif queued_event_kind == "end":
+                curr_page = num_pages - 1
+            elif queued_read[0] == sg.TIMEOUT_KEY:
+                return curr_page, None
+            else:
+                return curr_page, queued_read
+
     ##
     ## Run the main event loop.
     ##
 
+    CROP_POLL_MSECS = 50 # Time between window reads while waiting for a crop.
+
     zoom = False
     did_crop = False
     bounding_box_list = None
 
-    last_pre_crop = None
-    last_threshold = None
-    last_numSmooths = None
-    last_numBlurs = None
+    last_bounding_box_params = None # Options the saved bounding boxes were found with.
 
     old_window_size = window.size
+    prefetch_pages = get_pages_to_prefetch()
+    queued_read = None # A read saved while coalescing page navigation events.
 
     while True:
         page_change_event = False
@@ -1166,17 +1185,31 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
         resize_window_event = False
 
         prev_curr_page = curr_page
-        event, values_dict = window.Read()
+        if queued_read:
+            event, values_dict = queued_read
+            queued_read = None
+        else:
+            # Only wake up on a timeout when there are pages to prefetch.
+            read_timeout = PREFETCH_DELAY_MSECS if prefetch_pages else None
+            event, values_dict = window.Read(timeout=read_timeout)
+
+        if event == sg.TIMEOUT_KEY: # Can also come from a blocking read, so check.
+            if prefetch_pages:
+                document_pages.prerender_display_page(prefetch_pages.pop(0),
+                                                      get_max_image_size(window.size))
+            continue
 
         if event is None and (values_dict is None or values_dict["PageNumber"] is None):
             break
 
-        if event == sg.WIN_CLOSED or Events.is_exit(event):
-            if resize_thread_running:
-                request_thread_exit = True
+        event_kind = classify_event(event)
+
+        if event == sg.WIN_CLOSED or event_kind == "exit":
+            if resize_after_id is not None:
+                window.TKroot.after_cancel(resize_after_id)
             break
 
-        if Events.is_enter(event):
+        if event_kind == "enter":
             # This is for when a page number is manually entered in the window.
             call_all_update_funs(update_funs, values_dict)
             try:
@@ -1185,7 +1218,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                 curr_page = prev_curr_page
             page_change_event = True
 
-        if Events.is_page_num_change(event):
+        if event_kind == "page_num_change":
             call_all_update_funs(update_funs, values_dict)
             try:
                 curr_page = int(values_dict["PageNumber"]) - 1  # check if valid
@@ -1193,48 +1226,49 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                 curr_page = prev_curr_page
             page_change_event = True
 
-        elif Events.is_next(event):
+        elif event_kind == "next":
             curr_page += 1
             page_change_event = True
 
-        elif Events.is_prev(event):
+        elif event_kind == "prev":
             curr_page -= 1
             page_change_event = True
 
-        elif Events.is_up(event) and zoom:
+        elif event_kind == "up" and zoom:
             zoom = (clip_pos, 0, -1)
             update_page_image_event = True
 
-        elif Events.is_down(event) and zoom:
+        elif event_kind == "down" and zoom:
             zoom = (clip_pos, 0, 1)
             update_page_image_event = True
 
-        elif Events.is_home(event):
+        elif event_kind == "home":
             curr_page = 0
             page_change_event = True
 
-        elif Events.is_end(event):
+        elif event_kind == "end":
             curr_page = num_pages - 1
             page_change_event = True
 
-        elif Events.is_left(event) and zoom:
+        elif event_kind == "left" and zoom:
             zoom = (clip_pos, -1, 0)
             update_page_image_event = True
 
-        elif Events.is_right(event) and zoom:
+        elif event_kind == "right" and zoom:
             zoom = (clip_pos, 1, 0)
             update_page_image_event = True
 
-        elif Events.is_zoom(event): # Toggle.
+        elif event_kind == "zoom": # Toggle.
             if not zoom:
                 zoom = (clip_pos, 0, 0)
             else:
                 zoom = False
             update_page_image_event = True
 
-        elif Events.is_crop(event):
+        elif event_kind == "crop":
             call_all_update_funs(update_funs, values_dict)
             document_pages.close_document()
+            prefetch_pages = [] # Drop any prefetches for the closed document.
 
             # Display the wait message as a popup (unused alternative).
             #nonblock_popup = sg.PopupNoWait(
@@ -1257,41 +1291,48 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
             wait_indicator_text.Update(visible=True)
             window.Refresh()
 
-            # If the pre-crop values changed then bounding boxes must be redone.
-            all_pre_crop = args.absolutePreCrop + args.absolutePreCrop4
-            if last_pre_crop != all_pre_crop:
+            # If the pre-crop values or thresholding params changed then bounding
+            # boxes must be redone.
+            bounding_box_params = (tuple(args.absolutePreCrop), tuple(args.absolutePreCrop4),
+                                   args.threshold[0], args.numBlurs, args.numSmooths)
+            if last_bounding_box_params != bounding_box_params:
                 bounding_box_list = None # Kill saved bounding boxes.
-                last_pre_crop = all_pre_crop
-            # New thresholding params also require recalculation of bounding boxes.
-            if last_threshold != args.threshold[0]:
-                bounding_box_list = None
-                last_threshold = args.threshold[0]
-            if last_numBlurs != args.numBlurs:
-                bounding_box_list = None
-                last_numBlurs = args.numBlurs
-            if last_numSmooths != args.numSmooths:
-                bounding_box_list = None
-                last_numSmooths = args.numSmooths
-
-            # Do the crop, saving the bounding box list.
-            bounding_box_list, delta_page_nums = process_pdf_file(input_doc_fname,
-                                                                  fixed_input_doc_fname,
-                                                                  output_doc_fname,
-                                                                  bounding_box_list)
+                last_bounding_box_params = bounding_box_params
+
+            # Do the crop on a worker thread, saving the bounding box list.  The
+            # window keeps redrawing while it waits.  Other events are discarded,
+            # since the document is closed and PyMuPDF is not thread-safe.
+            if resize_after_id is not None:
+                window.TKroot.after_cancel(resize_after_id)
+                resize_after_id = None
+            exit_after_crop = False
+            crop_thread, crop_outcome = start_daemon_thread(process_pdf_file,
+                                                            input_doc_fname,
+                                                            fixed_input_doc_fname,
+                                                            output_doc_fname,
+                                                            bounding_box_list)
+            while crop_thread.is_alive() and not exit_after_crop:
+                crop_event, _ = window.Read(timeout=CROP_POLL_MSECS)
+                if crop_event == sg.WIN_CLOSED or classify_event(crop_event) == "exit":
+                    exit_after_crop = True # Exit once the crop finishes.
+            crop_thread.join()
+            if "exception" in crop_outcome:
+                raise crop_outcome["exception"]
+            bounding_box_list, delta_page_nums = crop_outcome["result"]
+
+            # Change the view to the new cropped file.
+            num_pages = document_pages.open_document(output_doc_fname)
+            did_crop = True
+            if exit_after_crop:
+                break
 
             update_smallest_delta_values_display(delta_page_nums, disabled=args.restore)
 
-            left_smallest_toggle = False
-            top_smallest_toggle = False
-            bottom_smallest_toggle = False
-            right_smallest_toggle = False
+            smallest_delta_toggles = [False] * 4 # Indexed like delta_page_nums.
 
             if args.restore:
                 combo_box_restore.Update("False")
 
-            # Change the view to the new cropped file.
-            num_pages = document_pages.open_document(output_doc_fname)
-            did_crop = True
             wait_indicator_text.Update(visible=False)
 
             update_page_image_event = True
@@ -1300,59 +1341,42 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
             if parsed_args.verbose:
                 print("\nWaiting for the GUI...")
 
-        elif Events.is_original(event):
+        elif event_kind == "original":
             call_all_update_funs(update_funs, values_dict)
             document_pages.close_document()
+            prefetch_pages = [] # Drop any prefetches for the closed document.
             num_pages = document_pages.open_document(fixed_input_doc_fname)
             did_crop = False
             set_delta_values_null()
             update_page_image_event = True
             resize_window_event = True
 
-        elif Events.is_left_smallest_delta(event):
-            curr_page, left_smallest_toggle = get_page_from_delta_page_nums(
-                                                              delta_page_nums,
-                                                              left_smallest_toggle, 0)
+        elif event_kind == "smallest_delta":
+            delta_index = SMALLEST_DELTA_INDICES[event]
+            curr_page, smallest_delta_toggles[delta_index] = get_page_from_delta_page_nums(
+                                                      delta_page_nums,
+                                                      smallest_delta_toggles[delta_index],
+                                                      delta_index)
             page_change_event = True
 
-        elif Events.is_top_smallest_delta(event):
-            curr_page, top_smallest_toggle = get_page_from_delta_page_nums(
-                                                              delta_page_nums,
-                                                              top_smallest_toggle, 3)
-            page_change_event = True
-
-        elif Events.is_bottom_smallest_delta(event):
-            curr_page, bottom_smallest_toggle = get_page_from_delta_page_nums(
-                                                              delta_page_nums,
-                                                              bottom_smallest_toggle, 1)
-            page_change_event = True
-
-        elif Events.is_right_smallest_delta(event):
-            curr_page, right_smallest_toggle = get_page_from_delta_page_nums(
-                                                              delta_page_nums,
-                                                              right_smallest_toggle, 2)
-            page_change_event = True
-
-        elif Events.is_paired_single_and_quadruple_change(event):
+        elif event_kind == "paired_single_and_quadruple_change":
             call_all_update_funs(update_funs, values_dict)
 
-        elif Events.is_evenodd(event):
+        elif event_kind == "evenodd":
             call_all_update_funs(update_funs, values_dict)
 
-        elif Events.is_general_checkbox_click(event):
+        elif event_kind == "general_checkbox_click":
             # This was added to try to make things more responsive on Windows, where multiple
             # checkbox clicks become unresponsive until something else is clicked or return
             # is entered in a box.  Doesn't help much.
             call_all_update_funs(update_funs, values_dict)
 
-        elif Events.is_configure(event): # Capture tkinter window resizes.
-            if window.size != old_window_size and not resize_thread_running:
-                # Note possible threading bug, calling pysimplegui from a thread:
-                # https://github.com/PySimpleGUI/PySimpleGUI/issues/4051
-                request_thread_exit = False
-                proc = threading.Thread(target=resize_page_on_configure_event)
-                proc.daemon = True
-                proc.start()
+        elif event_kind == "configure": # Capture tkinter window resizes.
+            if window.size != old_window_size:
+                schedule_resize_on_configure_event()
+
+        if event_kind in ("next", "prev", "home", "end"):
+            curr_page, queued_read = read_queued_page_navigation_events(curr_page)
 
         if page_change_event:
             curr_page = update_page_number(curr_page, prev_curr_page, num_pages, event,
@@ -1360,15 +1384,15 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
         # Resize the main GUI window if such an event was triggered.
         if resize_window_event:
-            resize_page_on_configure_event(delay_secs=0,
-                                           max_image_size=user_selected_max_image_size)
+            resize_page_on_configure_event(max_image_size=user_selected_max_image_size)
 
         # Get the current page and display it.
         if update_page_image_event or page_change_event:
-            reset_cached = Events.is_crop(event)
+            reset_cached = event_kind == "crop"
             image_data, clip_pos, im_ht, im_wid = update_page_image(window,
                                                                     reset_cached=reset_cached,
                                                                     zoom=zoom)
+            prefetch_pages = get_pages_to_prefetch(-1 if curr_page < prev_curr_page else 1)
 
     window.Close()
     document_pages.close_document() # Be sure document is closed (bug with -mo without this).
@@ -1381,21 +1405,28 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 wrapper = textwrap.TextWrapper(initial_indent="", subsequent_indent="", width=45,
                                break_on_hyphens=False)
 
-def get_help_text_string_for_tooltip(cmd_parser, option_string):
-    """Extract the help message for an option from an argparse command parser.
-    This gets the argparse help string to use as a tooltip."""
+def make_tooltip_getter(cmd_parser):
+    """Return a function that gets the help message for an option (named without
+    the leading "--") from an argparse command parser, formatted as a tooltip.
+    The parser's actions are only scanned once, and only the help messages that
+    are looked up get formatted."""
+    option_actions = {}
     for a in cmd_parser._actions:
-        if "--" + option_string in a.option_strings:
-            help_text = a.help
-            option_list = a.option_strings
-            break
-    else:
-        return None
-    help_text = textwrap.dedent(help_text)
-    formatted_para = wrapper.fill(help_text)
-    combined_para = " ".join(option_list) + "\n\n" + formatted_para
-    combined_para = combined_para.replace("^^n", "\n")
-    return combined_para
+        for option_string in a.option_strings:
+            if option_string.startswith("--"):
+                option_actions.setdefault(option_string[2:], a)
+
+    def get_tooltip(option_name):
+        a = option_actions.get(option_name)
+        if a is None or a.help is None:
+            return None
+        help_text = textwrap.dedent(a.help)
+        formatted_para = wrapper.fill(help_text)
+        combined_para = " ".join(a.option_strings) + "\n\n" + formatted_para
+        combined_para = combined_para.replace("^^n", "\n")
+        return combined_para
+
+    return get_tooltip
 
 def get_filename():
     """Get the filename of the PDF file via GUI if one was not passed in."""
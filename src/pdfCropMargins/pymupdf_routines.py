@@ -41,6 +41,7 @@ https://github.com/PySimpleGUI/PySimpleGUI/blob/master/DemoPrograms/Demo_PDF_Vie
 
 import sys
 import warnings
+from collections import OrderedDict
 from . import external_program_calls as ex
 
 try: # Extra dependencies for the GUI version.  Make sure they are installed.
@@ -65,6 +66,11 @@ RESTORE_METADATA_KEY = "pdfCropMarginsRestoreData" # Key for XML dict restore da
 # Limit precision to some reasonable amount to prevent problems in some PDF viewers.
 DECIMAL_PRECISION_FOR_MARGIN_POINT_VALUES = 8
 
+# Maximum number of rendered page images to keep for the GUI, and
+# the maximum total bytes for them (the PPM images are uncompressed).
+PAGE_IMAGE_CACHE_SIZE = 50
+PAGE_IMAGE_CACHE_MAX_BYTES = 128 * 2**20
+
 #
 # Utility functions.
 #
@@ -231,6 +237,8 @@ class MuPdfDocument:
         self.num_pages = 0
         self.page_display_list_cache = []
         self.page_crop_display_list_cache = []
+        self.page_image_cache = OrderedDict() # LRU cache of rendered page images.
+        self.max_width_and_height = None # Cached value, found from the pages.
 
     def open_document(self, doc_fname):
         """Open the document with fitz (PyMuPDF) and return the number of pages."""
@@ -275,6 +283,8 @@ class MuPdfDocument:
 
         self.page_display_list_cache = [None] * self.num_pages
         self.page_crop_display_list_cache = [None] * self.num_pages
+        self.page_image_cache.clear()
+        self.max_width_and_height = None
         return self.num_pages
 
     def get_page_sizes(self):
@@ -304,7 +314,9 @@ class MuPdfDocument:
 
     def get_max_width_and_height(self):
         """Return the maximum width and height (in points) of PDF pages in the
-        document."""
+        document.  The value is cached until a document is opened or closed."""
+        if self.max_width_and_height:
+            return self.max_width_and_height
         max_wid = -1
         max_ht = -1
         for page in self.document:
@@ -312,7 +324,8 @@ class MuPdfDocument:
                 max_wid = page.rect.width
             if page.rect.height > max_ht:
                 max_ht = page.rect.height
-        return max_wid, max_ht
+        self.max_width_and_height = max_wid, max_ht
+        return self.max_width_and_height
 
     def get_box_list(self, boxstring):
         """Get a list of all the boxes of the type `boxstring`, e.g. `"artbox"`
@@ -387,16 +400,17 @@ class MuPdfDocument:
 
     def get_display_page(self, page_num, max_image_size, zoom=False,
                          reset_cached=False):
-        """Return a `tkinter.PhotoImage` or a PNG image for a document page
-        number.  The `page_num` argument is a 0-based page number.  The
-        `zoom` argument is the top-left of old clip rect, and one of -1, 0,
-        +1 for dim. x or y to indicate the arrow key pressed.  The
-        `max_image_size` argument is the (width, height) of available image
-        area."""
+        """Return a PPM image (for `tkinter.PhotoImage`) of a document page.
+        The `page_num` argument is a 0-based page number.  The `zoom` argument
+        is the top-left of old clip rect, and one of -1, 0, +1 for dim. x or y
+        to indicate the arrow key pressed.  The `max_image_size` argument is
+        the (width, height) of available image area.  Rendered images are
+        cached; passing `reset_cached` clears the caches."""
         if not reset_cached:
             page_display_list = self.page_display_list_cache[page_num]
         else:
             page_display_list = None
+            self.page_image_cache.clear()
 
         if not page_display_list:  # Create if not yet there.
             self.page_display_list_cache[page_num] = self.document[page_num].get_displaylist()
@@ -405,13 +419,6 @@ class MuPdfDocument:
         page_rect = page_display_list.rect  # The page rectangle.
         clip = page_rect
 
-        # Make sure that all the images across the document will fit the screen.
-        max_wid, max_ht = self.get_max_width_and_height()
-
-        nozoom_scale = min(max_image_size[0]/max_wid,
-                           max_image_size[1]/max_ht)
-        nozoom_mat = fitz.Matrix(nozoom_scale, nozoom_scale)
-
         if zoom:
             width2 = page_rect.width / 2
             height2 = page_rect.height / 2
@@ -426,6 +433,22 @@ class MuPdfDocument:
             top_left.y = min(height2, top_left.y)    # the page rect
             clip = fitz.Rect(top_left, top_left.x + width2, top_left.y + height2)
 
+        image_cache_key = (page_num, tuple(max_image_size), tuple(clip) if zoom else None)
+        cached_image = self.page_image_cache.get(image_cache_key)
+        if cached_image:
+            self.page_image_cache.move_to_end(image_cache_key)
+            image_ppm, image_tl, image_height, image_width = cached_image
+            # Return a copy of the clip position, since zooming modifies it.
+            return image_ppm, fitz.Point(image_tl), image_height, image_width
+
+        # Make sure that all the images across the document will fit the screen.
+        max_wid, max_ht = self.get_max_width_and_height()
+
+        nozoom_scale = min(max_image_size[0]/max_wid,
+                           max_image_size[1]/max_ht)
+        nozoom_mat = fitz.Matrix(nozoom_scale, nozoom_scale)
+
+        if zoom:
             # Clip rect is ready, now fill it.
             zoom_mat = nozoom_mat * fitz.Matrix(2, 2)  # The zoom matrix.
             pixmap = page_display_list.get_pixmap(alpha=False, matrix=zoom_mat, clip=clip)
@@ -433,12 +456,26 @@ class MuPdfDocument:
         else:  # Show the total page.
             pixmap = page_display_list.get_pixmap(matrix=nozoom_mat, alpha=False)
 
-        #image_png = pixmap.tobytes()  # get the PNG image
         image_height, image_width = pixmap.height, pixmap.width
-        image_ppm = pixmap.tobytes("png")  # Make PPM image from pixmap for tkinter.
+        # Tkinter reads PPM directly, avoiding the PNG compress and decompress.
+        image_ppm = pixmap.tobytes("ppm")  # Make PPM image from pixmap for tkinter.
         image_tl = clip.tl # Clip position (top left).
+
+        self.page_image_cache[image_cache_key] = (image_ppm, fitz.Point(image_tl),
+                                                  image_height, image_width)
+        cache_bytes = sum(len(image[0]) for image in self.page_image_cache.values())
+        while len(self.page_image_cache) > 1 and (
+                len(self.page_image_cache) > PAGE_IMAGE_CACHE_SIZE
+                or cache_bytes > PAGE_IMAGE_CACHE_MAX_BYTES):
+            cache_bytes -= len(self.page_image_cache.popitem(last=False)[1][0])
         return image_ppm, image_tl, image_height, image_width
 
+    def prerender_display_page(self, page_num, max_image_size):
+        """Render the non-zoomed image for a page into the page image cache,
+        unless it is already there.  Used to prefetch neighboring pages."""
+        if (page_num, tuple(max_image_size), None) not in self.page_image_cache:
+            self.get_display_page(page_num, max_image_size)
+
     def get_full_page_box_list_assigning_media_and_crop(self, quiet=False):
         """Get a list of all the full-page box values for each page.  The boxes on
         the list are in the simple 4-float list format.  This is also where any